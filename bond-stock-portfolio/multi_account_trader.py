@@ -19,16 +19,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
+import cachetools
 import yaml
+
+try:  # libyaml-backed parser; falls back to pure Python when unavailable
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from alpaca_trade_api.rest import APIError, REST
 
 AllocationBasis = Literal["equity", "cash"]
 
+DEFAULT_BASE_URL = "https://paper-api.alpaca.markets"
+
 
 @dataclass
 class OrderAllocation:
@@ -52,14 +64,22 @@ class AccountConfig:
     name: str
     key_id: str
     secret_key: str
-    base_url: str = "https://paper-api.alpaca.markets"
+    base_url: str = DEFAULT_BASE_URL
     allocation_basis: AllocationBasis = "equity"
     max_notional_per_order: Optional[float] = None
     allocations: List[OrderAllocation] = field(default_factory=list)
 
 
+# Parsed-config cache keyed on path + mtime so repeated loads (e.g. when the
+# script is driven as a library from a scheduler loop) skip the YAML parse.
+_CONFIG_CACHE: Dict[str, Any] = {"path": None, "mtime_ns": 0, "accounts": None}
+
+
 def load_config(path: Path) -> List[AccountConfig]:
-    raw = yaml.safe_load(path.read_text())
+    stat = path.stat()
+    if _CONFIG_CACHE["path"] == path and _CONFIG_CACHE["mtime_ns"] == stat.st_mtime_ns:
+        return _CONFIG_CACHE["accounts"]
+    raw = yaml.load(path.read_bytes(), Loader=_YamlLoader)
     accounts: List[AccountConfig] = []
     for entry in raw.get("accounts", []):
         allocations = [
@@ -78,7 +98,7 @@ def load_config(path: Path) -> List[AccountConfig]:
                 name=entry["name"],
                 key_id=entry["key_id"],
                 secret_key=entry["secret_key"],
-                base_url=entry.get("base_url", "https://paper-api.alpaca.markets"),
+                base_url=entry.get("base_url", DEFAULT_BASE_URL),
                 allocation_basis=entry.get("allocation_basis", "equity"),
                 max_notional_per_order=entry.get("max_notional_per_order"),
                 allocations=allocations,
@@ -86,20 +106,63 @@ def load_config(path: Path) -> List[AccountConfig]:
         )
     if not accounts:
         raise ValueError("No accounts found in config. Check the YAML structure.")
+    _CONFIG_CACHE.update(path=path, mtime_ns=stat.st_mtime_ns, accounts=accounts)
     return accounts
 
 
-def _value_for_basis(account: Any, basis: AllocationBasis) -> float:
-    if basis == "cash":
-        return float(account.cash)
-    return float(account.equity)
+# Accounts typically share symbols, so a short-TTL cache lets one latest-trade
+# lookup serve every account in a fan-out instead of N identical Alpaca calls.
+# The lock guards the cache: the executor submits accounts concurrently.
+_TRADE_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=128, ttl=15)
+_TRADE_CACHE_LOCK = threading.Lock()
+
+
+def _latest_trade_price(rest: REST, symbol: str) -> float:
+    with _TRADE_CACHE_LOCK:
+        cached = _TRADE_CACHE.get(symbol)
+    if cached is not None:
+        return cached
+    price = float(rest.get_latest_trade(symbol).price)
+    with _TRADE_CACHE_LOCK:
+        _TRADE_CACHE[symbol] = price
+    return price
+
+
+@functools.lru_cache(maxsize=32)
+def _rest_client(key_id: str, secret_key: str, base_url: str) -> REST:
+    """Return one REST client per credential set.
+
+    REST owns a requests.Session, so reusing the instance keeps the
+    TCP+TLS connection alive across calls instead of re-handshaking.
+    """
+    return REST(key_id=key_id, secret_key=secret_key, base_url=base_url)
 
 
 def _submit_orders_for_account(
     cfg: AccountConfig, dry_run: bool, allow_fractional: bool
 ) -> Dict[str, Any]:
-    rest = REST(key_id=cfg.key_id, secret_key=cfg.secret_key, base_url=cfg.base_url)
-    account = rest.get_account()
+    rest = _rest_client(cfg.key_id, cfg.secret_key, cfg.base_url)
+    if allow_fractional:
+        account = rest.get_account()
+        prices: Dict[str, float] = {}
+    else:
+        # The account snapshot and the per-symbol price lookups are mutually
+        # independent, so issue them together instead of paying one serial
+        # round-trip per allocation.
+        symbols = {alloc.symbol for alloc in cfg.allocations}
+        with ThreadPoolExecutor(max_workers=len(symbols) + 1) as executor:
+            account_future = executor.submit(rest.get_account)
+            price_futures = {
+                symbol: executor.submit(_latest_trade_price, rest, symbol)
+                for symbol in symbols
+            }
+            account = account_future.result()
+            prices = {sym: future.result() for sym, future in price_futures.items()}
+    # Cast the account fields once; every allocation reads from these.
+    basis_values: Dict[AllocationBasis, float] = {
+        "equity": float(account.equity),
+        "cash": float(account.cash),
+    }
     account_summary = {
         "account": cfg.name,
         "submitted": [],
@@ -107,7 +170,8 @@ def _submit_orders_for_account(
     }
     for alloc in cfg.allocations:
         basis = alloc.normalized_basis(cfg.allocation_basis)
-        reference_value = _value_for_basis(account, basis)
+        # Unknown bases fall back to equity, as _value_for_basis always did.
+        reference_value = basis_values.get(basis, basis_values["equity"])
         notional = reference_value * alloc.percentage
         if cfg.max_notional_per_order:
             notional = min(notional, float(cfg.max_notional_per_order))
@@ -128,7 +192,7 @@ def _submit_orders_for_account(
         if allow_fractional:
             payload["notional"] = round(notional, 2)
         else:
-            latest_price = float(rest.get_latest_trade(alloc.symbol).price)
+            latest_price = prices[alloc.symbol]
             qty = int(notional // latest_price)
             if qty == 0:
                 account_summary["skipped"].append(
@@ -172,13 +236,16 @@ async def fan_out_orders(
     accounts: List[AccountConfig], dry_run: bool, allow_fractional: bool
 ) -> List[Dict[str, Any]]:
     loop = asyncio.get_running_loop()
-    tasks = [
-        loop.run_in_executor(
-            None, _submit_orders_for_account, cfg, dry_run, allow_fractional
-        )
-        for cfg in accounts
-    ]
-    return await asyncio.gather(*tasks)
+    # Size the pool to the account count so every account's HTTP calls are
+    # in flight at once; the default executor caps workers by CPU count.
+    with ThreadPoolExecutor(max_workers=len(accounts)) as executor:
+        tasks = [
+            loop.run_in_executor(
+                executor, _submit_orders_for_account, cfg, dry_run, allow_fractional
+            )
+            for cfg in accounts
+        ]
+        return await asyncio.gather(*tasks)
 
 
 def parse_args() -> argparse.Namespace: